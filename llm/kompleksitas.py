@@ -0,0 +1,13 @@
+from bisect import bisect_right
+
+# total_tasks thresholds for kompleksitas 2..5 (1 task = 1, 15+ tasks = 5)
+KOMPLEKSITAS_THRESHOLDS = [2, 5, 10, 15]
+
+
+# =============================
+# 📊 Fungsi: Kompleksitas
+# =============================
+
+def get_kompleksitas(task_count: int) -> int:
+    """Hitung kompleksitas (1-5) berdasarkan jumlah task"""
+    return bisect_right(KOMPLEKSITAS_THRESHOLDS, task_count) + 1
@@ -1,12 +1,65 @@
-import json
+import orjson
+import argparse
 import requests
-import re
 import os
 import hashlib
+import threading
 from pathlib import Path
 from typing import Dict, List
 from datetime import datetime
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import llm_cache
+from kompleksitas import get_kompleksitas
+
+# Parallel Ollama requests (match the server's OLLAMA_NUM_PARALLEL). The
+# server treats 0 as "auto", so fall back to 4 and never go below 1
+OLLAMA_NUM_PARALLEL = max(1, int(os.environ.get("OLLAMA_NUM_PARALLEL", "4")) or 4)
+
+# Caps in-flight generate requests across all files at OLLAMA_NUM_PARALLEL
+LLM_SLOTS = threading.BoundedSemaphore(OLLAMA_NUM_PARALLEL)
+
+# Reuse one connection pool for every Ollama request. Connection errors and
+# transient 502/503/504s (e.g. while the model is loading) are retried with
+# backoff for generate calls only, so the /api/tags preflight fails fast
+# when Ollama is down. Read errors are never retried: a stalled generation
+# is not resent while it holds an LLM_SLOTS permit
+SESSION = requests.Session()
+SESSION.mount("http://localhost:11434/api/generate", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=max(32, OLLAMA_NUM_PARALLEL),
+    max_retries=Retry(total=3, read=False, backoff_factor=0.5,
+                      status_forcelist=[502, 503, 504],
+                      allowed_methods=["GET", "POST"],
+                      raise_on_status=False)))
+
+# Task names listed per person in the prompt; the rest are summarized as a count
+MAX_PROMPT_TASKS_PER_PERSON = 10
+
+# Bump whenever the prompt changes so cached LLM responses are invalidated
+PROMPT_VERSION = "v3"
+
+# Fixed part of the extraction prompt; identical for every person
+EXTRACTION_INSTRUCTIONS = """You are a data extraction assistant. Create the entry for the person below.
+Use the person's name exactly as given, in lowercase, and the project name in lowercase.
+Dates, tasks and kompleksitas are filled in afterwards, so do not return them.
+
+Return ONLY valid JSON (no markdown, no explanation):
+{"fullname": "lowercase name", "project": "lowercase project"}
+"""
+
+# Output shape enforced by Ollama's structured outputs (format=<schema>)
+EXTRACTION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "fullname": {"type": "string"},
+        "project": {"type": "string"},
+    },
+    "required": ["fullname", "project"],
+}
 
 # =============================
 # 🔧 Fungsi: Check Ollama & Model
@@ -16,7 +69,7 @@ from collections import defaultdict
 def check_ollama_model(model_name: str = "llama3.2:3b") -> bool:
     """Check apakah Ollama running dan model tersedia"""
     try:
-        response = requests.get("http://localhost:11434/api/tags", timeout=5)
+        response = SESSION.get("http://localhost:11434/api/tags", timeout=5)
         if response.status_code != 200:
             print("❌ Ollama tidak running")
             print("💡 Jalankan: ollama serve")
@@ -41,6 +94,21 @@ def check_ollama_model(model_name: str = "llama3.2:3b") -> bool:
         return False
 
 
+def warm_up_model(model_name: str = "llama3.2:3b"):
+    """Load model ke memory sebelum ekstraksi dimulai"""
+    # A generate call without a prompt only loads the model, so the parallel
+    # extraction requests don't all queue behind the cold start
+    try:
+        print(f"🔥 Loading model '{model_name}'...")
+        SESSION.post(
+            "http://localhost:11434/api/generate",
+            json={"model": model_name, "keep_alive": "30m"},
+            timeout=(10, 300)
+        )
+    except Exception as e:
+        print(f"⚠️ Warm-up failed: {e}")
+
+
 # =============================
 # 📂 Fungsi: Scan JSON Files
 # =============================
@@ -48,10 +116,10 @@ def check_ollama_model(model_name: str = "llama3.2:3b") -> bool:
 def get_file_hash(file_path: str) -> str:
     """Generate hash untuk file untuk tracking"""
     with open(file_path, 'rb') as f:
-        return hashlib.md5(f.read()).hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
-def scan_json_files(folder_path: str) -> List[Dict]:
+def scan_json_files(folder_path: str, processed_data: Dict = None) -> List[Dict]:
     """Scan semua file JSON di folder"""
     json_files = []
     folder = Path(folder_path)
@@ -60,35 +128,88 @@ def scan_json_files(folder_path: str) -> List[Dict]:
         print(f"❌ Folder tidak ditemukan: {folder_path}")
         return []
 
-    for file_path in folder.glob("*.json"):
+    # Files whose name, size and mtime match a tracked entry keep their hash,
+    # so unchanged files cost one stat() instead of a full read
+    known_hashes = {
+        (f["name"], f["size"], f["mtime_ns"]): f["hash"]
+        for f in (processed_data or {}).get("processed_files", [])
+        if "size" in f and "mtime_ns" in f
+    }
+
+    def hash_file(entry: os.DirEntry):
         try:
-            file_hash = get_file_hash(str(file_path))
+            st = entry.stat()
+            file_hash = known_hashes.get(
+                (entry.name, st.st_size, st.st_mtime_ns))
+            if not file_hash:
+                file_hash = get_file_hash(entry.path)
+            return entry, st, file_hash, None
+        except Exception as e:
+            return entry, None, None, e
+
+    # scandir yields name and file type from the directory listing itself,
+    # without glob's per-entry pattern matching
+    with os.scandir(folder) as it:
+        entries = [entry for entry in it
+                   if entry.name.endswith(".json") and entry.is_file()]
+
+    # Hash files in parallel so disk reads overlap with hashing; the work is
+    # I/O-bound, so use more threads than cores
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        for entry, st, file_hash, error in executor.map(hash_file, entries):
+            if error:
+                print(f"⚠️ Error reading {entry.name}: {error}")
+                continue
             json_files.append({
-                "path": str(file_path),
-                "name": file_path.name,
-                "hash": file_hash
+                "path": entry.path,
+                "name": entry.name,
+                "hash": file_hash,
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns
             })
-        except Exception as e:
-            print(f"⚠️ Error reading {file_path.name}: {e}")
 
     return json_files
 
 
-def load_processed_files(tracking_file: str) -> Dict:
-    """Load daftar file yang sudah diproses"""
+def load_processed_files(tracking_file: str, legacy_file: str = None) -> Dict:
+    """Load daftar file yang sudah diproses (JSONL, satu record per baris)"""
+    processed_files = []
+
     if os.path.exists(tracking_file):
+        with open(tracking_file, 'rb') as f:
+            for line in f:
+                try:
+                    processed_files.append(orjson.loads(line))
+                except orjson.JSONDecodeError:
+                    # Skip blank lines and a partial last line from an interrupted append
+                    continue
+
+    elif legacy_file and os.path.exists(legacy_file):
+        # One-time migration from the old single-document tracking file
         try:
-            with open(tracking_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(legacy_file, 'rb') as f:
+                processed_files = orjson.loads(f.read()).get("processed_files", [])
         except:
-            return {"processed_files": []}
-    return {"processed_files": []}
+            processed_files = []
+        if processed_files:
+            save_processed_files(tracking_file, processed_files)
+            print(f"🔁 Migrated {len(processed_files)} tracked files from {legacy_file}")
+
+    return {"processed_files": processed_files}
 
 
-def save_processed_files(tracking_file: str, processed_data: Dict):
-    """Simpan daftar file yang sudah diproses"""
-    with open(tracking_file, 'w', encoding='utf-8') as f:
-        json.dump(processed_data, f, indent=2, ensure_ascii=False)
+def save_processed_files(tracking_file: str, entries: List[Dict]):
+    """Tambahkan record file yang baru diproses ke tracking file"""
+    # Append-only: each run writes just its own records instead of
+    # re-serializing the whole history
+    with open(tracking_file, 'a+b') as f:
+        # Terminate a partial last line left by an interrupted append, or the
+        # first new record would be glued onto it and dropped on load
+        if f.seek(0, os.SEEK_END) > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+        f.write(b"".join(orjson.dumps(entry) + b"\n" for entry in entries))
 
 
 def get_unprocessed_files(json_files: List[Dict], processed_data: Dict) -> List[Dict]:
@@ -102,124 +223,154 @@ def get_unprocessed_files(json_files: List[Dict], processed_data: Dict) -> List[
 # 🧠 Fungsi: Ekstraksi dengan LLM
 # =============================
 
-def extract_with_llm(json_data: Dict, model: str = "llama3.2:3b"):
-    """Ekstraksi menggunakan LLM dengan explicit task-to-resource mapping"""
+def estimate_num_ctx(prompt: str, num_predict: int) -> int:
+    """Context size for prompt + answer (~4 chars/token), rounded up to 2048"""
+    needed = len(prompt) // 4 + num_predict
+    return max(4096, -(-needed // 2048) * 2048)
 
-    project_name = json_data.get("project", {}).get("name", "Unknown Project")
-    tasks = json_data.get("tasks", [])
 
-    # Build explicit mapping per person
-    resource_mapping = defaultdict(list)
-    for task in tasks:
-        resource = task.get("resource", "").strip()
-        if resource:
-            resource_mapping[resource].append({
-                "id": task.get("id"),
-                "task_name": task.get("task_name"),
-                "start_date": task.get("start_date"),
-                "finish_date": task.get("finish_date"),
-            })
-
-    # Create very explicit prompt with per-person breakdown
-    person_sections = []
-    for resource, task_list in resource_mapping.items():
-        task_details = "\n".join([
-            f"   - Task: {t['task_name']} | Start: {t['start_date']} | Finish: {t['finish_date']}"
-            for t in task_list
-        ])
-        person_sections.append(f"""
-Person: {resource}
-Number of tasks: {len(task_list)}
-Tasks:
-{task_details}
-""")
+def extract_person_with_llm(resource: str, task_names: List[str], project_name: str,
+                            model: str = "llama3.2:3b"):
+    """Ekstraksi satu orang menggunakan LLM (satu prompt kecil per orang)"""
 
-    people_breakdown = "\n".join(person_sections)
-
-    prompt = f"""You are a data extraction assistant. Extract work information for each person.
+    # Identical prompt input returns the stored response without calling Ollama
+    cache_key = llm_cache.make_key(
+        model, PROMPT_VERSION,
+        {"project": project_name, "person": resource, "tasks": task_names})
+    cached = llm_cache.get(cache_key)
+    if cached and cached.get("fullname") == resource:
+        return cached
 
+    # Static instructions go first so Ollama can reuse their cached KV prefix
+    prompt = f"""{EXTRACTION_INSTRUCTIONS}
 Project: {project_name}
-
-{people_breakdown}
-
-STRICT RULES:
-1. Create ONE entry per person
-2. Convert task names to LOWERCASE
-3. start_date: earliest start date (single date string, not array)
-4. finish_date: latest finish date (single date string, not array)
-5. Calculate kompleksitas based on total_tasks:
-   - 1 task = kompleksitas 1
-   - 2-4 tasks = kompleksitas 2
-   - 5-9 tasks = kompleksitas 3
-   - 10-14 tasks = kompleksitas 4
-   - 15+ tasks = kompleksitas 5
-6. Return fullname in lowercase
-7. Return project name in lowercase
-
-Return ONLY valid JSON (no markdown, no explanation):
-{{
-  "data": [
-    {{
-      "fullname": "lowercase name",
-      "project": "lowercase project",
-      "start_date": "YYYY-MM-DD",
-      "finish_date": "YYYY-MM-DD",
-      "total_tasks": 0,
-      "tasks": ["lowercase task 1", "lowercase task 2"],
-      "kompleksitas": 0
-    }}
-  ]
-}}"""
+Person: {resource}
+Tasks: {orjson.dumps(task_names).decode()}"""
+
+    # The answer is a single short object
+    num_predict = 128
+    options = {
+        "temperature": 0.1,
+        "top_p": 0.9,
+        "num_predict": num_predict,
+        "num_ctx": estimate_num_ctx(prompt, num_predict),
+        "repeat_penalty": 1.1,
+    }
 
     try:
-        print("   📤 Sending to LLM...")
-        response = requests.post(
-            "http://localhost:11434/api/generate",
-            json={
-                "model": model,
-                "prompt": prompt,
-                "stream": False,
-                "format": "json",
-                "options": {
-                    "temperature": 0.1,
-                    "top_p": 0.9,
-                    "num_predict": 8192,
-                    "num_ctx": 16384,
-                    "repeat_penalty": 1.1,
-                }
-            },
-            timeout=300
-        )
-
-        if response.status_code != 200:
-            print(f"   ❌ HTTP Error {response.status_code}")
-            return None
+        # Schema-constrained output only fails to parse when generation was cut off
+        # at num_predict, so retry once with a doubled token budget
+        for attempt in range(2):
+            # Keep in-flight requests across all files within the server's slots
+            # Closing the response returns its connection to SESSION's pool
+            with LLM_SLOTS, SESSION.post(
+                    "http://localhost:11434/api/generate",
+                    json={
+                        "model": model,
+                        "prompt": prompt,
+                        "stream": True,
+                        "format": EXTRACTION_SCHEMA,
+                        "keep_alive": "30m",
+                        "options": options
+                    },
+                    timeout=(10, 300),
+                    stream=True) as response:
+
+                if response.status_code != 200:
+                    print(f"   ❌ HTTP Error {response.status_code} ({resource})")
+                    return None
+
+                # Read the stream to its end so the connection can be reused;
+                # the final chunk (done=true) carries the done_reason
+                chunks = []
+                done_reason = None
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    part = orjson.loads(line)
+                    chunks.append(part.get("response", ""))
+                    if part.get("done"):
+                        done_reason = part.get("done_reason")
+
+            raw = "".join(chunks).strip()
 
-        raw = response.json().get("response", "").strip()
-
-        # Parse JSON
-        try:
-            cleaned = re.sub(r'```json\s*|\s*```', '', raw).strip()
-            result = json.loads(cleaned)
-
-            if "data" in result and isinstance(result["data"], list):
-                # Post-process: ensure all data is correct
-                result = post_process_result(result, json_data)
-                print(f"   ✅ Extracted {len(result['data'])} people")
-                return result
-            else:
-                print("   ⚠️ Invalid JSON structure")
+            try:
+                result = orjson.loads(raw)
+                break
+            except orjson.JSONDecodeError as e:
+                if done_reason == "length" and attempt == 0:
+                    print(f"   ⚠️ Output truncated ({resource}), retrying with a larger token budget")
+                    options["num_predict"] *= 2
+                    options["num_ctx"] = estimate_num_ctx(
+                        prompt, options["num_predict"])
+                    continue
+                print(f"   ⚠️ JSON decode error ({resource}): {e}")
                 return None
 
-        except json.JSONDecodeError as e:
-            print(f"   ⚠️ JSON decode error: {e}")
+        if isinstance(result, dict) and isinstance(result.get("fullname"), str):
+            # fullname is the key post_process_result looks tasks up by, so pin
+            # it to the known resource instead of trusting the model's spelling
+            result["fullname"] = resource
+            # Cache the raw response; post-processing is cheap and always rerun.
+            # A failed cache write must not throw away a good answer
+            try:
+                llm_cache.put(cache_key, result, model, PROMPT_VERSION)
+            except OSError as e:
+                print(f"   ⚠️ Cache write failed ({resource}): {e}")
+            return result
+        else:
+            print(f"   ⚠️ Invalid JSON structure ({resource})")
             return None
 
     except Exception as e:
-        print(f"   ❌ Error: {e}")
+        print(f"   ❌ Error ({resource}): {e}")
         return None
 
 
+def extract_with_llm(json_data: Dict, model: str = "llama3.2:3b"):
+    """Ekstraksi menggunakan LLM dengan explicit task-to-resource mapping"""
+
+    project_name = json_data.get("project", {}).get("name", "Unknown Project")
+    tasks = json_data.get("tasks", [])
+
+    # Build explicit mapping per person, keyed like post_process_result so
+    # differently-cased spellings of one name share a single prompt
+    resource_mapping = defaultdict(list)
+    for task in tasks:
+        resource = task.get("resource", "").lower().strip()
+        if resource:
+            resource_mapping[resource].append(task.get("task_name"))
+
+    # The model only has to name each person; post_process_result rebuilds
+    # every other field from the source tasks. A few task names per person
+    # are enough context, the full list only adds prompt tokens.
+    people = {}
+    for resource, task_names in resource_mapping.items():
+        shown = task_names[:MAX_PROMPT_TASKS_PER_PERSON]
+        if len(task_names) > MAX_PROMPT_TASKS_PER_PERSON:
+            shown.append(
+                f"... and {len(task_names) - MAX_PROMPT_TASKS_PER_PERSON} more")
+        people[resource] = shown
+
+    # One small prompt per person, sent in parallel: Ollama batches them and
+    # each answer is a single object instead of the whole array
+    print(f"   📤 Sending {len(people)} person prompt(s) to LLM...")
+    with ThreadPoolExecutor(max_workers=OLLAMA_NUM_PARALLEL) as executor:
+        entries = list(executor.map(
+            lambda item: extract_person_with_llm(
+                item[0], item[1], project_name, model),
+            people.items()))
+
+    if any(entry is None for entry in entries):
+        print("   ⚠️ LLM extraction failed for some people")
+        return None
+
+    # Post-process: ensure all data is correct
+    result = post_process_result({"data": entries}, json_data)
+    print(f"   ✅ Extracted {len(result['data'])} people")
+    return result
+
+
 # =============================
 # 🔧 Post-Process Result
 # =============================
@@ -229,12 +380,16 @@ def post_process_result(result: Dict, original_data: Dict) -> Dict:
 
     tasks = original_data.get("tasks", [])
 
+    # Group tasks by resource once instead of rescanning them per person
+    tasks_by_resource = defaultdict(list)
+    for task in tasks:
+        tasks_by_resource[task.get("resource", "").lower().strip()].append(task)
+
     for person in result.get("data", []):
         fullname = person.get("fullname", "").lower().strip()
 
         # Get all tasks for this person from original data
-        person_tasks = [t for t in tasks if t.get(
-            "resource", "").lower() == fullname]
+        person_tasks = tasks_by_resource.get(fullname, [])
 
         # Rebuild data correctly
         start_dates = []
@@ -266,16 +421,7 @@ def post_process_result(result: Dict, original_data: Dict) -> Dict:
 
         # Calculate kompleksitas correctly
         task_count = person["total_tasks"]
-        if task_count >= 15:
-            person["kompleksitas"] = 5
-        elif task_count >= 10:
-            person["kompleksitas"] = 4
-        elif task_count >= 5:
-            person["kompleksitas"] = 3
-        elif task_count >= 2:
-            person["kompleksitas"] = 2
-        else:
-            person["kompleksitas"] = 1
+        person["kompleksitas"] = get_kompleksitas(task_count)
 
         # Ensure lowercase
         person["fullname"] = fullname
@@ -284,6 +430,28 @@ def post_process_result(result: Dict, original_data: Dict) -> Dict:
     return result
 
 
+# =============================
+# 📐 Fungsi: Ekstraksi Deterministik
+# =============================
+
+def extract_deterministic(json_data: Dict) -> Dict:
+    """Ekstraksi tanpa LLM: semua field dihitung langsung dari tasks"""
+
+    project_name = json_data.get("project", {}).get("name", "Unknown Project")
+
+    # post_process_result rebuilds every field from the original tasks,
+    # so one stub entry per resource is all it needs
+    people = {}
+    for task in json_data.get("tasks", []):
+        resource = task.get("resource", "").lower().strip()
+        if resource and resource not in people:
+            people[resource] = {"fullname": resource, "project": project_name}
+
+    result = post_process_result({"data": list(people.values())}, json_data)
+    print(f"   ✅ Extracted {len(result['data'])} people")
+    return result
+
+
 # =============================
 # 🔀 Fungsi: Merge & Group Data by Person
 # =============================
@@ -322,44 +490,36 @@ def merge_and_group_by_person(existing_data: Dict, new_data: Dict) -> Dict:
                 "kompleksitas": person.get("kompleksitas", 0)
             })
 
-    # Merge duplicates (same person + same project)
+    # Merge duplicates (same person + same project) in one pass; colliding
+    # task lists are unioned into sets and sorted once at the end
     merged_dict = {}
+    merged_tasks = {}
     for entry in temp_data:
         key = (entry["fullname"], entry["project"])
 
-        if key in merged_dict:
-            existing = merged_dict[key]
-
-            # Merge tasks
-            all_tasks = list(set(existing["tasks"] + entry["tasks"]))
-            existing["tasks"] = sorted(all_tasks)
-            existing["total_tasks"] = len(all_tasks)
-
-            # Get earliest start and latest finish
-            dates = [existing["start_date"], entry["start_date"]]
-            dates = [d for d in dates if d]
-            if dates:
-                existing["start_date"] = min(dates)
-
-            dates = [existing["finish_date"], entry["finish_date"]]
-            dates = [d for d in dates if d]
-            if dates:
-                existing["finish_date"] = max(dates)
-
-            # Recalculate kompleksitas
-            task_count = existing["total_tasks"]
-            if task_count >= 15:
-                existing["kompleksitas"] = 5
-            elif task_count >= 10:
-                existing["kompleksitas"] = 4
-            elif task_count >= 5:
-                existing["kompleksitas"] = 3
-            elif task_count >= 2:
-                existing["kompleksitas"] = 2
-            else:
-                existing["kompleksitas"] = 1
-        else:
+        if key not in merged_dict:
             merged_dict[key] = entry
+            continue
+
+        existing = merged_dict[key]
+
+        # Merge tasks
+        if key not in merged_tasks:
+            merged_tasks[key] = set(existing["tasks"])
+        merged_tasks[key].update(entry["tasks"])
+
+        # Get earliest start and latest finish (ISO dates compare as strings)
+        if entry["start_date"] and (not existing["start_date"] or entry["start_date"] < existing["start_date"]):
+            existing["start_date"] = entry["start_date"]
+        if entry["finish_date"] and (not existing["finish_date"] or entry["finish_date"] > existing["finish_date"]):
+            existing["finish_date"] = entry["finish_date"]
+
+    # Finalize merged entries: sort tasks and recalculate kompleksitas once
+    for key, all_tasks in merged_tasks.items():
+        existing = merged_dict[key]
+        existing["tasks"] = sorted(all_tasks)
+        existing["total_tasks"] = len(all_tasks)
+        existing["kompleksitas"] = get_kompleksitas(len(all_tasks))
 
     # Group by person
     people_dict = defaultdict(list)
@@ -387,23 +547,45 @@ def merge_and_group_by_person(existing_data: Dict, new_data: Dict) -> Dict:
 
 
 # =============================
-# 📂 Load JSON File
+# 📂 Load & Save JSON File
 # =============================
 
 def load_json_file(file_path: str):
     """Load JSON file"""
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(file_path, "rb") as f:
+            data = orjson.loads(f.read())
         return data
     except FileNotFoundError:
         print(f"   ❌ File not found: {file_path}")
         return None
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         print(f"   ❌ Invalid JSON file")
         return None
 
 
+def save_json_file(file_path: str, data, option: int = 0) -> bool:
+    """Simpan JSON secara atomic (tulis ke .tmp lalu os.replace)"""
+    content = orjson.dumps(data, option=option)
+
+    # Leave an identical file untouched so its mtime doesn't change and
+    # anything watching it (e.g. the dashboard) isn't triggered needlessly
+    try:
+        with open(file_path, "rb") as f:
+            if f.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+
+    # An interrupted write only ever leaves the .tmp file behind, never a
+    # truncated output that would force re-running the whole extraction
+    tmp_path = file_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(content)
+    os.replace(tmp_path, file_path)
+    return True
+
+
 # =============================
 # 🎯 Main Execution
 # =============================
@@ -416,31 +598,46 @@ if __name__ == "__main__":
     # Configuration
     input_folder = "../extract"
     output_file = "../../dashboard-project-plan/data/projects.json"
-    tracking_file = ".processed_files.json"
+    tracking_file = ".processed_files.jsonl"
+    legacy_tracking_file = ".processed_files.json"
+
+    parser = argparse.ArgumentParser(
+        description="Extract per-person project data from ScanDocument JSON output")
+    parser.add_argument("--llm", action="store_true",
+                        help="Extract with the Ollama LLM instead of directly from the tasks")
+    args = parser.parse_args()
 
-    # Check for available models
-    model_options = ["llama3.2:3b", "llama3.1:8b", "qwen2.5:7b"]
     model_name = None
 
-    print("🔍 Checking available models...")
-    for model in model_options:
-        if check_ollama_model(model):
-            model_name = model
-            break
+    if args.llm:
+        # Check for available models
+        model_options = ["llama3.2:3b", "llama3.1:8b", "qwen2.5:7b"]
+        # Allow a pre-quantized build (e.g. llama3.2:3b-instruct-q8_0) to be tried first
+        if os.environ.get("OLLAMA_MODEL"):
+            model_options.insert(0, os.environ["OLLAMA_MODEL"])
 
-    if not model_name:
-        print("\n❌ No suitable LLM model found!")
-        print("💡 Install one of these:")
+        print("🔍 Checking available models...")
         for model in model_options:
-            print(f"   - ollama pull {model}")
-        exit(1)
+            if check_ollama_model(model):
+                model_name = model
+                break
+
+        if not model_name:
+            print("\n❌ No suitable LLM model found!")
+            print("💡 Install one of these:")
+            for model in model_options:
+                print(f"   - ollama pull {model}")
+            exit(1)
+
+        print(f"✅ Using model: {model_name}")
+        print()
 
-    print(f"✅ Using model: {model_name}")
-    print()
+    # Load processed files tracking
+    processed_data = load_processed_files(tracking_file, legacy_tracking_file)
 
     # Scan JSON files
     print(f"📂 Scanning folder: {input_folder}")
-    json_files = scan_json_files(input_folder)
+    json_files = scan_json_files(input_folder, processed_data)
 
     if not json_files:
         print("❌ No JSON files found!")
@@ -449,8 +646,6 @@ if __name__ == "__main__":
     print(f"✅ Found {len(json_files)} JSON files")
     print()
 
-    # Load processed files tracking
-    processed_data = load_processed_files(tracking_file)
     unprocessed_files = get_unprocessed_files(json_files, processed_data)
 
     if not unprocessed_files:
@@ -468,8 +663,8 @@ if __name__ == "__main__":
     existing_results = {"people": []}
     if os.path.exists(output_file):
         try:
-            with open(output_file, 'r', encoding='utf-8') as f:
-                existing_results = json.load(f)
+            with open(output_file, 'rb') as f:
+                existing_results = orjson.loads(f.read())
             
             # Count total entries
             total_entries = sum(len(p.get("projects", [])) for p in existing_results.get("people", []))
@@ -480,21 +675,16 @@ if __name__ == "__main__":
         print("📝 No existing results, starting fresh")
     print()
 
-    # Process each unprocessed file
-    all_new_data = {"data": []}
-    processed_count = 0
-
+    # Load every file first, then fan the LLM calls out in parallel
+    jobs = []
     for idx, file_info in enumerate(unprocessed_files, 1):
         print(
-            f"🔄 Processing [{idx}/{len(unprocessed_files)}]: {file_info['name']}")
-        print("-" * 70)
+            f"🔄 Loading [{idx}/{len(unprocessed_files)}]: {file_info['name']}")
 
-        # Load file
         json_data = load_json_file(file_info['path'])
 
         if not json_data:
             print(f"   ⚠️ Skipping due to load error")
-            print()
             continue
 
         project_name = json_data.get('project', {}).get('name', 'Unknown')
@@ -502,28 +692,60 @@ if __name__ == "__main__":
 
         print(f"   📌 Project: {project_name}")
         print(f"   📋 Total tasks: {total_tasks}")
+        jobs.append((file_info, json_data, project_name))
+    print()
 
-        # Extract with LLM
-        result = extract_with_llm(json_data, model_name)
+    all_new_data = {"data": []}
+    processed_count = 0
+    new_processed_files = []
+
+    if args.llm:
+        if jobs:
+            warm_up_model(model_name)
+        workers = OLLAMA_NUM_PARALLEL
+        # Submit files in order of task count so each parallel wave holds
+        # similarly sized prompts and a large file doesn't stall small ones
+        jobs.sort(key=lambda job: len(job[1].get("tasks", [])))
+    else:
+        workers = 1
 
-        if result:
-            # Accumulate new data (still in flat format)
-            for person in result.get("data", []):
-                all_new_data["data"].append(person)
+    print(f"🧠 Extracting {len(jobs)} file(s), {workers} in parallel...")
+    print("-" * 70)
 
-            # Mark as processed
-            processed_data["processed_files"].append({
-                "name": file_info['name'],
-                "hash": file_info['hash'],
-                "processed_at": datetime.now().isoformat(),
-                "project": project_name
-            })
-            processed_count += 1
-            print(f"   ✅ Successfully processed!")
-        else:
-            print(f"   ❌ Failed to process")
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+        for file_info, json_data, project_name in jobs:
+            if args.llm:
+                future = executor.submit(
+                    extract_with_llm, json_data, model_name)
+            else:
+                future = executor.submit(extract_deterministic, json_data)
+            futures[future] = (file_info, project_name)
+
+        for future in as_completed(futures):
+            file_info, project_name = futures[future]
+            result = future.result()
+
+            if result:
+                # Accumulate new data (still in flat format)
+                for person in result.get("data", []):
+                    all_new_data["data"].append(person)
+
+                # Mark as processed
+                new_processed_files.append({
+                    "name": file_info['name'],
+                    "hash": file_info['hash'],
+                    "size": file_info['size'],
+                    "mtime_ns": file_info['mtime_ns'],
+                    "processed_at": datetime.now().isoformat(),
+                    "project": project_name
+                })
+                processed_count += 1
+                print(f"   ✅ Successfully processed: {file_info['name']}")
+            else:
+                print(f"   ❌ Failed to process: {file_info['name']}")
 
-        print()
+    print()
 
     # Merge with existing results and group by person
     if processed_count > 0:
@@ -543,13 +765,14 @@ if __name__ == "__main__":
         print()
 
         # Save results
-        print(f"💾 Saving to: {output_file}")
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(final_results, f, indent=2, ensure_ascii=False)
+        if save_json_file(output_file, final_results, orjson.OPT_INDENT_2):
+            print(f"💾 Saving to: {output_file}")
+        else:
+            print(f"💾 Output unchanged: {output_file}")
 
         # Save processed files tracking
-        save_processed_files(tracking_file, processed_data)
+        save_processed_files(tracking_file, new_processed_files)
         print(f"💾 Updated tracking file: {tracking_file}")
         print()
 
@@ -558,18 +781,24 @@ if __name__ == "__main__":
         print("📊 SUMMARY BY PERSON:")
         print("=" * 70)
 
+        # Build the whole summary first and write it with a single print;
+        # it grows with the database and one write per line adds up
+        summary_lines = []
         for person in final_results.get("people", []):
             fullname = person.get("fullname", "unknown")
             projects = person.get("projects", [])
             total_tasks = sum(p.get("total_tasks", 0) for p in projects)
 
-            print(f"\n👤 {fullname.upper()}")
-            print("-" * 70)
-            print(f"   📋 Total projects: {len(projects)}")
-            print(f"   📋 Total tasks: {total_tasks}")
+            summary_lines.append(f"\n👤 {fullname.upper()}")
+            summary_lines.append("-" * 70)
+            summary_lines.append(f"   📋 Total projects: {len(projects)}")
+            summary_lines.append(f"   📋 Total tasks: {total_tasks}")
 
             for project in projects:
-                print(f"   📌 {project.get('project', 'unknown')}: {project.get('total_tasks', 0)} tasks")
+                summary_lines.append(f"   📌 {project.get('project', 'unknown')}: {project.get('total_tasks', 0)} tasks")
+
+        if summary_lines:
+            print("\n".join(summary_lines))
 
         print()
         print("=" * 70)
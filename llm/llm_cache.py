@@ -0,0 +1,71 @@
+import os
+import hashlib
+import orjson
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+# Default location and lifetime of cached LLM responses
+CACHE_DIR = ".extract_cache"
+CACHE_TTL_DAYS = 30
+
+
+# =============================
+# 🔑 Fungsi: Cache Key
+# =============================
+
+def make_key(model: str, prompt_version: str, payload) -> str:
+    """Key content-addressable dari model, versi prompt, dan input prompt"""
+    # Sorted keys make the key independent of dict insertion order
+    canonical = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    digest = hashlib.sha256()
+    digest.update(prompt_version.encode() + b"\x00")
+    digest.update(model.encode() + b"\x00")
+    digest.update(canonical)
+    return digest.hexdigest()
+
+
+# =============================
+# 💾 Fungsi: Get & Put
+# =============================
+
+def get(key: str, cache_dir: str = CACHE_DIR) -> Optional[Dict]:
+    """Ambil response LLM dari cache, None jika tidak ada atau kadaluarsa"""
+    cache_path = os.path.join(cache_dir, f"{key}.json")
+
+    # Any unreadable or malformed entry is a miss; the response is regenerated
+    try:
+        with open(cache_path, "rb") as f:
+            entry = orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+    if not isinstance(entry, dict):
+        return None
+    expires_at = entry.get("expires_at")
+    if not isinstance(expires_at, str) or expires_at < datetime.now().isoformat():
+        return None
+
+    response = entry.get("response")
+    return response if isinstance(response, dict) else None
+
+
+def put(key: str, response: Dict, model: str, prompt_version: str,
+        cache_dir: str = CACHE_DIR, ttl_days: int = CACHE_TTL_DAYS):
+    """Simpan response LLM ke cache"""
+    os.makedirs(cache_dir, exist_ok=True)
+
+    now = datetime.now()
+    entry = {
+        "model": model,
+        "prompt_version": prompt_version,
+        "response": response,
+        "created_at": now.isoformat(),
+        "expires_at": (now + timedelta(days=ttl_days)).isoformat(),
+    }
+
+    # Write atomically so an interrupted run never leaves a partial entry
+    cache_path = os.path.join(cache_dir, f"{key}.json")
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(orjson.dumps(entry))
+    os.replace(tmp_path, cache_path)
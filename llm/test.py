@@ -1,10 +1,53 @@
 import json
+import orjson
+import argparse
 import requests
-import re
 from pathlib import Path
 from typing import Dict, List
-from datetime import datetime
+from datetime import date
 from collections import defaultdict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from kompleksitas import get_kompleksitas
+
+# Reuse one connection pool for every Ollama request; connection errors and
+# transient 502/503/504s (e.g. while the model is loading) are retried with
+# backoff for generate calls only, so the /api/tags preflight fails fast when
+# Ollama is down. Read errors are never retried, so a stalled generation is
+# not resent
+SESSION = requests.Session()
+SESSION.mount("http://localhost:11434/api/generate", HTTPAdapter(
+    pool_connections=4, pool_maxsize=4,
+    max_retries=Retry(total=3, read=False, backoff_factor=0.5,
+                      status_forcelist=[502, 503, 504],
+                      allowed_methods=["GET", "POST"],
+                      raise_on_status=False)))
+
+# Output shape enforced by Ollama's structured outputs (format=<schema>)
+EXTRACTION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "data": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "fullname": {"type": "string"},
+                    "project": {"type": "string"},
+                    "start_date": {"type": "array", "items": {"type": "string"}},
+                    "finish_date": {"type": "array", "items": {"type": "string"}},
+                    "total_tasks": {"type": "integer"},
+                    "duration_days": {"type": "integer"},
+                    "task": {"type": "array", "items": {"type": "string"}},
+                    "kompleksitas": {"type": "integer"},
+                },
+                "required": ["fullname", "project"],
+            },
+        },
+    },
+    "required": ["data"],
+}
 
 # =============================
 # 🔧 Fungsi: Check Ollama & Model
@@ -14,7 +57,7 @@ from collections import defaultdict
 def check_ollama_model(model_name: str = "llama3.2:3b") -> bool:
     """Check apakah Ollama running dan model tersedia"""
     try:
-        response = requests.get("http://localhost:11434/api/tags", timeout=5)
+        response = SESSION.get("http://localhost:11434/api/tags", timeout=5)
         if response.status_code != 200:
             print("❌ Ollama tidak running")
             print("💡 Jalankan: ollama serve")
@@ -114,13 +157,14 @@ Return ONLY valid JSON (no markdown, no explanation):
 
     try:
         print("📤 Sending to LLM...")
-        response = requests.post(
+        response = SESSION.post(
             "http://localhost:11434/api/generate",
             json={
                 "model": model,
                 "prompt": prompt,
                 "stream": False,
-                "format": "json",
+                "format": EXTRACTION_SCHEMA,
+                "keep_alive": "30m",
                 "options": {
                     "temperature": 0.1,
                     "top_p": 0.9,
@@ -143,8 +187,7 @@ Return ONLY valid JSON (no markdown, no explanation):
 
         # Parse JSON
         try:
-            cleaned = re.sub(r'```json\s*|\s*```', '', raw).strip()
-            result = json.loads(cleaned)
+            result = orjson.loads(raw)
 
             if "data" in result and isinstance(result["data"], list):
                 # Post-process: ensure all data is correct
@@ -155,7 +198,7 @@ Return ONLY valid JSON (no markdown, no explanation):
                 print("⚠️ Invalid JSON structure")
                 return None
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             print(f"⚠️ JSON decode error: {e}")
             return None
 
@@ -169,17 +212,22 @@ Return ONLY valid JSON (no markdown, no explanation):
 # =============================
 # 🔧 Post-Process Result
 # =============================
+
 def post_process_result(result: Dict, original_data: Dict) -> Dict:
     """Post-process LLM result to ensure correctness"""
 
     tasks = original_data.get("tasks", [])
 
+    # Group tasks by resource once instead of rescanning them per person
+    tasks_by_resource = defaultdict(list)
+    for task in tasks:
+        tasks_by_resource[task.get("resource", "").lower().strip()].append(task)
+
     for person in result.get("data", []):
         fullname = person.get("fullname", "").lower().strip()
 
         # Get all tasks for this person from original data
-        person_tasks = [t for t in tasks if t.get(
-            "resource", "").lower() == fullname]
+        person_tasks = tasks_by_resource.get(fullname, [])
 
         # Rebuild arrays correctly
         start_dates = []
@@ -200,10 +248,9 @@ def post_process_result(result: Dict, original_data: Dict) -> Dict:
         # Calculate duration correctly
         if start_dates and finish_dates:
             try:
-                earliest_start = min(datetime.strptime(
-                    d, "%Y-%m-%d") for d in start_dates)
-                latest_finish = max(datetime.strptime(d, "%Y-%m-%d")
-                                    for d in finish_dates)
+                # YYYY-MM-DD sorts lexically, so only parse the two bounds
+                earliest_start = date.fromisoformat(min(start_dates))
+                latest_finish = date.fromisoformat(max(finish_dates))
                 person["duration_days"] = (
                     latest_finish - earliest_start).days + 1
             except:
@@ -211,16 +258,7 @@ def post_process_result(result: Dict, original_data: Dict) -> Dict:
 
         # Calculate kompleksitas correctly
         task_count = person["total_tasks"]
-        if task_count >= 15:
-            person["kompleksitas"] = 5
-        elif task_count >= 10:
-            person["kompleksitas"] = 4
-        elif task_count >= 5:
-            person["kompleksitas"] = 3
-        elif task_count >= 2:
-            person["kompleksitas"] = 2
-        else:
-            person["kompleksitas"] = 1
+        person["kompleksitas"] = get_kompleksitas(task_count)
 
         # Ensure lowercase
         person["fullname"] = fullname
@@ -302,6 +340,12 @@ def load_json_file(file_path: str):
 # 🎯 Main Execution
 # =============================
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Extract per-person project data from one ScanDocument JSON file with the LLM")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Also print the full extraction result as JSON")
+    args = parser.parse_args()
+
     print("🚀 Project Task Extraction - Fixed LLM Version")
     print("=" * 70)
     print()
@@ -368,11 +412,13 @@ if __name__ == "__main__":
 
     # Display results
     print()
-    print("=" * 70)
-    print("📊 HASIL EKSTRAKSI:")
-    print("=" * 70)
-    print(json.dumps(result, indent=2, ensure_ascii=False))
-    print()
+    # The full JSON dump is diagnostic only; the summary below covers it
+    if args.verbose:
+        print("=" * 70)
+        print("📊 HASIL EKSTRAKSI:")
+        print("=" * 70)
+        print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
+        print()
 
     # Summary per person
     print("👥 RINGKASAN PER ORANG:")
@@ -404,7 +450,8 @@ if __name__ == "__main__":
 
     # Save
     output_file = "../../dashboard-project-plan/data/projects.json"
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    with open(output_file, "wb") as f:
+        f.write(orjson.dumps(
+            result, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
     print(f"💾 Saved to: {output_file}")
     print("✅ Process complete!")
\ No newline at end of file
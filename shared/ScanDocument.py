@@ -13,18 +13,33 @@ Usage:
 """
 
 import re
+import io
 import json
 import argparse
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-import pdfplumber
+from functools import lru_cache
+from collections import Counter
+from itertools import repeat
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 import os
+import sys
+import time
+import logging
+
+# pdfminer logs every parsed token at DEBUG level; keep it quiet even when a
+# caller lowers the root log level, or extraction slows down dramatically
+logging.getLogger("pdfminer").setLevel(logging.ERROR)
+logging.getLogger("pdfplumber").setLevel(logging.ERROR)
 
 # ------------------------------
 # Utility helpers
 # ------------------------------
+# Most common format first: task dates look like "Wed 6/12/24" and the
+# weekday is stripped before parsing
 DATE_FORMAT_TRIES = [
-    "%m/%d/%Y", "%m/%d/%y",
+    "%m/%d/%y", "%m/%d/%Y",
     "%Y-%m-%d",
     "%b %d, '%y", "%b %d, %Y", "%B %d, %Y",
     "%a %m/%d/%y", "%A %m/%d/%y",
@@ -32,20 +47,70 @@ DATE_FORMAT_TRIES = [
     "%a %m/%d/%Y", "%A %m/%d/%Y",
 ]
 
-
+# Patterns are compiled once here; they run per line and per token
+_TRAILING_PUNCT_RE = re.compile(r"[?•\u2022]+$")
+_WEEKDAY_PREFIX_RE = re.compile(r'^[A-Za-z]{3,}\s+')
+_MONTH_DAY_YEAR_RE = re.compile(r'([A-Za-z]+)\s+(\d{1,2})[,\s]*\'?(\d{2,4})')
+_MDY_RE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{2,4})$')
+_NUMERIC_MDY_RE = re.compile(r'([0-9]{1,2})/([0-9]{1,2})/([0-9]{4}|[0-9]{2})$')
+
+# Tokens that are not resource names: a date, a month or weekday prefix
+# (any case), or a calendar day label such as "S" or "TF" (upper case only)
+_RESOURCE_REJECT_RE = re.compile(
+    r'\d{1,2}/\d{1,2}/\d{2,4}'
+    r'|(?i:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec'
+    r'|Mon|Tue|Wed|Thu|Fri|Sat|Sun)'
+    r'|[SMTWRF]{1,2}(?:\s|$)')
+_HAS_LETTER_RE = re.compile(r'[a-zA-Z]')
+_EXCLUDE_TOKENS = frozenset([
+    'page', 'task', 'external', 'tasks', 'manual', 'finish-only',
+    'split', 'milestone', 'duration-only', 'deadline', 'project',
+    'summary', 'inactive', 'rollup', 'progress', 'start-only',
+    'date', 'finish', 'start', 'duration', 'predecessor', 'id'])
+
+_PROJECT_RE = re.compile(r'Project:\s*(.+)', re.IGNORECASE)
+_PROJECT_DATE_SUFFIX_RE = re.compile(r'\s+Date:.*$')
+_HEADER_RE = re.compile(r'\bID\b.*\bTask[^\S\n]*Name\b', re.IGNORECASE)
+_LEGEND_TASK_RE = re.compile(r'\bTask\s+External\s+Tasks\b')
+_LEGEND_MILESTONE_RE = re.compile(r'\bMilestone\s+Inactive\b')
+_DATE_HEADER_ROW_RE = re.compile(r'^\d+\s+\d+\s+\d+\s+\d+')
+_TASK_ROW_RE = re.compile(r'^(\d{1,3})[^\S\n]+(.+)$', re.MULTILINE)
+_OTHER_LINE_BREAK_RE = re.compile(r'[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]')
+# <task_name> <duration> <start_date> <finish_date> <remaining tokens>
+_TASK_LINE_RE = re.compile(
+    r'^(.+?)\s+([\d.]+\s+days?\??)\s+((?:[A-Za-z]{3}\s+)?\d{1,2}/\d{1,2}/\d{2,4})\s+((?:[A-Za-z]{3}\s+)?\d{1,2}/\d{1,2}/\d{2,4})\s*(.*)$',
+    re.IGNORECASE)
+_DURATION_VALUE_RE = re.compile(r'([\d.]+)')
+
+
+@lru_cache(maxsize=4096)
 def try_parse_date(s: str) -> Optional[str]:
     s = str(s).strip()
     if not s:
         return None
 
     # remove trailing question marks or extra punctuation
-    s = re.sub(r"[?•\u2022]+$", "", s).strip()
+    s = _TRAILING_PUNCT_RE.sub("", s).strip()
     # remove weekday prefix like "Fri " or "Thu "
-    s = re.sub(r'^[A-Za-z]{3,}\s+', '', s)
+    s = _WEEKDAY_PREFIX_RE.sub('', s)
 
     # some PDF outputs include formats like "Jul 20, '25" -> normalize apostrophe
     s = s.replace("'", "'").replace("`", "'")
 
+    # Fast path for numeric m/d/y dates, the common case: build the date
+    # directly instead of letting strptime fail through the format list
+    m = _NUMERIC_MDY_RE.match(s)
+    if m:
+        mm, dd, yy = m.groups()
+        yr = int(yy)
+        if len(yy) == 2:
+            # Same pivot as strptime's %y: 69-99 -> 1900s, 00-68 -> 2000s
+            yr += 1900 if yr >= 69 else 2000
+        try:
+            return datetime(yr, int(mm), int(dd)).strftime("%Y-%m-%d")
+        except ValueError:
+            pass
+
     for fmt in DATE_FORMAT_TRIES:
         try:
             dt = datetime.strptime(s, fmt)
@@ -54,7 +119,7 @@ def try_parse_date(s: str) -> Optional[str]:
             pass
 
     # Try to catch month day year without comma: "Jul 20 25" or "Jul 20 2025"
-    m = re.match(r'([A-Za-z]+)\s+(\d{1,2})[,\s]*\'?(\d{2,4})', s)
+    m = _MONTH_DAY_YEAR_RE.match(s)
     if m:
         mon, day, yr = m.groups()
         try:
@@ -67,7 +132,7 @@ def try_parse_date(s: str) -> Optional[str]:
             pass
 
     # Try mm/dd with 2-digit year w/o leading zeros
-    m = re.match(r'(\d{1,2})/(\d{1,2})/(\d{2,4})$', s)
+    m = _MDY_RE.match(s)
     if m:
         mm, dd, yy = m.groups()
         if len(yy) == 2:
@@ -84,43 +149,21 @@ def try_parse_date(s: str) -> Optional[str]:
 def is_valid_resource_name(token: str) -> bool:
     """Check if token is a valid resource name (not a date, number, or calendar label)"""
     token = token.strip()
-    if not token:
-        return False
-
-    # Exclude pure numbers
-    if token.isdigit():
-        return False
 
-    # Exclude date patterns
-    if re.match(r'\d{1,2}/\d{1,2}/\d{2,4}', token):
+    # Must be at least 2 characters; exclude pure numbers
+    if len(token) < 2 or token.isdigit():
         return False
 
-    # Exclude month patterns
-    if re.match(r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)', token, re.IGNORECASE):
-        return False
-
-    # Exclude weekday patterns
-    if re.match(r'^(Mon|Tue|Wed|Thu|Fri|Sat|Sun)', token, re.IGNORECASE):
-        return False
-
-    # Exclude calendar day labels
-    if re.match(r'^[SMTWRF]{1,2}(\s+|$)', token):
+    # Exclude date, month, weekday and calendar day label patterns
+    if _RESOURCE_REJECT_RE.match(token):
         return False
 
     # Exclude common non-resource tokens
-    exclude_tokens = ['page', 'task', 'external', 'tasks', 'manual', 'finish-only',
-                      'split', 'milestone', 'duration-only', 'deadline', 'project',
-                      'summary', 'inactive', 'rollup', 'progress', 'start-only',
-                      'date', 'finish', 'start', 'duration', 'predecessor', 'id']
-    if token.lower() in exclude_tokens:
+    if token.lower() in _EXCLUDE_TOKENS:
         return False
 
     # Must contain at least one letter
-    if not re.search(r'[a-zA-Z]', token):
-        return False
-
-    # Must be at least 2 characters
-    if len(token) < 2:
+    if not _HAS_LETTER_RE.search(token):
         return False
 
     return True
@@ -129,10 +172,38 @@ def is_valid_resource_name(token: str) -> bool:
 # Main Extractor
 # ------------------------------
 
+# Below this many pages a single PDF is not worth splitting across processes
+PARALLEL_MIN_PAGES = 10
+
+
+def _extract_pages_text(pdf_path: str, page_numbers: Optional[List[int]] = None) -> List[str]:
+    """Extract text per page (1-based page_numbers; None means all pages)"""
+    import pdfplumber  # deferred: pulls in pdfminer, slow to import
+
+    with pdfplumber.open(pdf_path, pages=page_numbers) as pdf:
+        return _pages_text(pdf.pages)
+
+
+def _pages_text(pages) -> List[str]:
+    """Extract text from already-opened pdfplumber pages"""
+    parts = []
+    for page in pages:
+        try:
+            page_text = page.extract_text() or ""
+        except Exception:
+            page_text = ""
+        # pdf.pages keeps every Page alive until the file is closed;
+        # drop each page's parsed layout objects once its text is out
+        page.flush_cache()
+        parts.append(page_text)
+    return parts
+
 
 class ProjectPlanExtractor:
-    def __init__(self, debug: bool = False):
+    def __init__(self, debug: bool = False, workers: int = 1, engine: str = "pdfplumber"):
         self.debug = debug
+        self.workers = workers
+        self.engine = engine
         self.project_name: Optional[str] = None
 
     def extract_from_pdf(self, pdf_path: str) -> Optional[Dict[str, Any]]:
@@ -148,15 +219,18 @@ class ProjectPlanExtractor:
 
         self.project_name = self._extract_project_name(
             text) or os.path.splitext(os.path.basename(pdf_path))[0]
-        tasks = self._parse_text_to_tasks(text)
-
-        # Filter: only keep tasks with resources
-        tasks_with_resources = [t for t in tasks if t.get(
-            "resources") and len(t["resources"]) > 0]
+        # Filter while parsing: only keep tasks with resources, so tasks
+        # without any are never held in memory as a full list
+        total_scanned = 0
+        tasks_with_resources = []
+        for t in self._parse_text_to_tasks(text):
+            total_scanned += 1
+            if t.get("resources"):
+                tasks_with_resources.append(t)
 
         if not tasks_with_resources:
             print(f"⚠️  No tasks with resources found in this PDF")
-            print(f"   Total tasks scanned: {len(tasks)}")
+            print(f"   Total tasks scanned: {total_scanned}")
             print(f"   Tasks with resources: 0")
             return None
 
@@ -175,7 +249,7 @@ class ProjectPlanExtractor:
             "project": {
                 "name": self.project_name,
                 "total_tasks": len(expanded_tasks),
-                "total_tasks_scanned": len(tasks),
+                "total_tasks_scanned": total_scanned,
                 "original_tasks_with_resources": len(tasks_with_resources),
                 "extracted_at": datetime.now().isoformat()
             },
@@ -183,13 +257,52 @@ class ProjectPlanExtractor:
         }
 
     def _extract_text(self, pdf_path: str) -> str:
-        parts = []
+        if self.engine == "pymupdf":
+            text = self._extract_text_fitz(pdf_path)
+            if text is not None:
+                return text
+
+        import pdfplumber
+
+        # Small documents (the usual case) are extracted from the handle that
+        # counted their pages; only large ones are reopened per worker
+        parts = None
         with pdfplumber.open(pdf_path) as pdf:
-            for i, page in enumerate(pdf.pages):
-                try:
-                    page_text = page.extract_text() or ""
-                except Exception:
-                    page_text = ""
+            page_count = len(pdf.pages)
+            if self.workers <= 1 or page_count < PARALLEL_MIN_PAGES:
+                parts = _pages_text(pdf.pages)
+
+        if parts is None:
+            # Split the pages into one contiguous range per worker; each worker
+            # opens the PDF with only its own pages
+            workers = min(self.workers, page_count)
+            size = -(-page_count // workers)
+            chunks = [list(range(start + 1, min(start + size, page_count) + 1))
+                      for start in range(0, page_count, size)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parts = [text for chunk in executor.map(
+                    _extract_pages_text, repeat(pdf_path), chunks) for text in chunk]
+
+        if self.debug:
+            for i, page_text in enumerate(parts):
+                print(f"Extracted page {i+1}: {len(page_text)} chars")
+        return "\n".join(parts)
+
+    def _extract_text_fitz(self, pdf_path: str) -> Optional[str]:
+        """
+        Extract text with PyMuPDF, which is much faster than pdfplumber.
+        Returns None (caller falls back to pdfplumber) if it is unavailable.
+        """
+        try:
+            import fitz  # PyMuPDF, optional
+        except ImportError:
+            print("⚠️  PyMuPDF not installed, falling back to pdfplumber")
+            return None
+
+        parts = []
+        with fitz.open(pdf_path) as doc:
+            for i, page in enumerate(doc):
+                page_text = page.get_text("text") or ""
                 parts.append(page_text)
                 if self.debug:
                     print(f"Extracted page {i+1}: {len(page_text)} chars")
@@ -198,11 +311,11 @@ class ProjectPlanExtractor:
     def _extract_project_name(self, text: str) -> Optional[str]:
         # Common header: "Project: <name>"
         for line in text.splitlines():
-            m = re.search(r'Project:\s*(.+)', line, re.IGNORECASE)
+            m = _PROJECT_RE.search(line)
             if m:
                 name = m.group(1).strip()
                 # Clean up the name - remove "Date:" suffix if present
-                name = re.sub(r'\s+Date:.*$', '', name)
+                name = _PROJECT_DATE_SUFFIX_RE.sub('', name)
                 if name:
                     return name
         return None
@@ -237,13 +350,15 @@ class ProjectPlanExtractor:
                     if not resource or not resource.strip():
                         continue
 
+                    # duration and predecessors are never mutated after
+                    # parsing, so the per-resource copies can share them
                     task_copy = {
                         "id": task["id"],
                         "task_name": task["task_name"],
-                        "duration": task["duration"].copy(),
+                        "duration": task["duration"],
                         "start_date": task["start_date"],
                         "finish_date": task["finish_date"],
-                        "predecessors": task["predecessors"].copy() if task["predecessors"] else [],
+                        "predecessors": task["predecessors"],
                         "resource": resource
                     }
                     expanded.append(task_copy)
@@ -254,42 +369,42 @@ class ProjectPlanExtractor:
 
         return expanded
 
-    def _parse_text_to_tasks(self, text: str) -> List[Dict[str, Any]]:
-        lines = [ln for ln in text.splitlines()]
-        tasks: List[Dict[str, Any]] = []
-
-        # Find where task data starts - look for lines starting with digit
-        start_idx = 0
-        for i, ln in enumerate(lines):
-            # Skip header lines
-            if re.search(r'\bID\b.*\bTask\s*Name\b', ln, re.IGNORECASE):
-                start_idx = i + 1
-                if self.debug:
-                    print(
-                        f"Found header at line {i}, starting parse from line {start_idx}")
-                break
+    def _parse_text_to_tasks(self, text: str) -> Iterator[Dict[str, Any]]:
+        # Rows are matched straight from the text below, which treats only
+        # "\n" as a line break; fold any other splitlines() separators first
+        if _OTHER_LINE_BREAK_RE.search(text):
+            text = "\n".join(text.splitlines())
+
+        # Find where task data starts: the line after the table header
+        start = 0
+        header = _HEADER_RE.search(text)
+        if header:
+            start = text.find("\n", header.end()) + 1 or len(text)
+            if self.debug:
+                header_line = text.count("\n", 0, header.start())
+                print(
+                    f"Found header at line {header_line}, starting parse from line {header_line + 1}")
 
-        for line_num, ln in enumerate(lines[start_idx:], start=start_idx):
-            if not ln.strip():
-                continue
+        # Only rows starting with a task ID (1-3 digits followed by space and
+        # text) are materialized, instead of a string per line of the PDF
+        line_num = text.count("\n", 0, start) if self.debug else 0
+        last_pos = start
+        for m in _TASK_ROW_RE.finditer(text, start):
+            ln = m.group(0)
 
             # Skip page footers and non-task lines
-            if (ln.strip().startswith("Page") or
-                'Project:' in ln or
-                re.search(r'\bTask\s+External\s+Tasks\b', ln) or
-                re.search(r'\bMilestone\s+Inactive\b', ln) or
-                    re.search(r'^\d+\s+\d+\s+\d+\s+\d+', ln)):  # Skip date header rows
-                continue
-
-            # Look for lines starting with task ID (1-3 digits followed by space and text)
-            m = re.match(r'^(\d{1,3})\s+(.+)$', ln)
-            if not m:
+            if ('Project:' in ln or
+                _LEGEND_TASK_RE.search(ln) or
+                _LEGEND_MILESTONE_RE.search(ln) or
+                    _DATE_HEADER_ROW_RE.search(ln)):  # Skip date header rows
                 continue
 
             task_id = m.group(1)
             remainder = m.group(2).strip()
 
             if self.debug:
+                line_num += text.count("\n", last_pos, m.start())
+                last_pos = m.start()
                 print(f"\n--- Line {line_num}: ID={task_id} ---")
                 print(f"Remainder: {remainder[:200]}")
 
@@ -297,12 +412,10 @@ class ProjectPlanExtractor:
             task = self._parse_task_line(task_id, remainder)
 
             if task:
-                tasks.append(task)
                 if self.debug:
                     print(f"✓ Parsed: {task['task_name']}")
                     print(f"  Resources: {task.get('resources', [])}")
-
-        return tasks
+                yield task
 
     def _parse_task_line(self, task_id: str, remainder: str) -> Optional[Dict[str, Any]]:
         """
@@ -312,11 +425,9 @@ class ProjectPlanExtractor:
         Example: "Requirement Gathering II 4 days Wed 6/12/24 Wed 6/19/24 Herman Herman"
         """
 
-        # Pattern to match: text, then duration, then two dates, then remaining tokens
-        # Duration pattern: number + "day" or "days"
-        pattern = r'^(.+?)\s+([\d.]+\s+days?\??)\s+((?:[A-Za-z]{3}\s+)?\d{1,2}/\d{1,2}/\d{2,4})\s+((?:[A-Za-z]{3}\s+)?\d{1,2}/\d{1,2}/\d{2,4})\s*(.*)$'
-
-        m = re.match(pattern, remainder, re.IGNORECASE)
+        # Match: text, then duration (number + "day" or "days"), then two
+        # dates, then remaining tokens
+        m = _TASK_LINE_RE.match(remainder)
 
         if not m:
             if self.debug:
@@ -341,14 +452,8 @@ class ProjectPlanExtractor:
         resources = []
 
         if remaining:
-            # Split by whitespace
-            tokens = remaining.split()
-
-            for token in tokens:
-                token = token.strip()
-                if not token:
-                    continue
-
+            # split() already drops whitespace and never yields empty tokens
+            for token in remaining.split():
                 # Check if it's a predecessor (pure digit)
                 if token.isdigit():
                     predecessors.append(token)
@@ -358,8 +463,7 @@ class ProjectPlanExtractor:
                 elif is_valid_resource_name(token):
                     # Split by comma if contains comma
                     if ',' in token:
-                        sub_resources = [r.strip()
-                                         for r in token.split(',') if r.strip()]
+                        sub_resources = [r for r in token.split(',') if r]
                         for sub_r in sub_resources:
                             if is_valid_resource_name(sub_r):
                                 resources.append(sub_r)
@@ -375,10 +479,10 @@ class ProjectPlanExtractor:
         unique_resources = []
         seen = set()
         for r in resources:
-            r_clean = r.strip()
-            if r_clean and r_clean.lower() not in seen:
-                unique_resources.append(r_clean)
-                seen.add(r_clean.lower())
+            r_lower = r.lower()
+            if r_lower not in seen:
+                unique_resources.append(r)
+                seen.add(r_lower)
 
         task = {
             "id": task_id,
@@ -398,12 +502,18 @@ class ProjectPlanExtractor:
         value = 0.0
         unit = "days"
         raw = dur
-        m = re.search(r'([\d.]+)', dur)
-        if m:
-            try:
-                value = float(m.group(1))
-            except:
-                value = 0.0
+        # Durations look like "<number> day(s)": take the leading number
+        # directly and only fall back to the regex for anything else
+        first = dur.split(None, 1)[0] if dur else ""
+        if first.replace(".", "", 1).isdecimal():
+            value = float(first)
+        else:
+            m = _DURATION_VALUE_RE.search(dur)
+            if m:
+                try:
+                    value = float(m.group(1))
+                except ValueError:
+                    value = 0.0
 
         # Normalize dates
         sd_raw = str(task.get("start_date", "")).strip()
@@ -439,17 +549,14 @@ class ProjectPlanExtractor:
         print(
             f"📦 Original tasks with resources: {data['project']['original_tasks_with_resources']}")
 
-        # Show resources found
-        resources = set()
-        for task in data['tasks']:
-            if task.get('resource'):
-                resources.add(task['resource'])
+        # Show resources found, counted in one pass over the tasks
+        resource_counts = Counter(
+            t['resource'] for t in data['tasks'] if t.get('resource'))
 
-        if resources:
-            print(f"\n👥 Resources found ({len(resources)}):")
-            for r in sorted(resources):
-                count = sum(1 for t in data['tasks'] if t.get('resource') == r)
-                print(f"   - {r}: {count} tasks")
+        if resource_counts:
+            print(f"\n👥 Resources found ({len(resource_counts)}):")
+            for r in sorted(resource_counts):
+                print(f"   - {r}: {resource_counts[r]} tasks")
 
         # Show sample of extracted tasks
         if data.get('tasks'):
@@ -458,29 +565,93 @@ class ProjectPlanExtractor:
                 print(f"   [{task['id']}] {task['task_name']}")
                 print(f"      → Resource: {task.get('resource', 'N/A')}")
 
-    def save_txt(self, data: Dict[str, Any], output_path: str):
-        lines = []
-        for t in data["tasks"]:
-            lines.append(
-                f"[{t['id']}] {t['task_name']} -> {t.get('resource', '')}")
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
-        print(f"✅ Saved TXT to {output_path}")
-
-    def save_md(self, data: Dict[str, Any], output_path: str):
-        md = [f"# Project: {data['project']['name']}\n"]
-        for t in data["tasks"]:
-            md.append(
-                f"### Task {t['id']}\n- **Name:** {t['task_name']}\n- **Resource:** {t.get('resource','')}\n- **Start:** {t['start_date']}\n- **Finish:** {t['finish_date']}\n")
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(md))
-        print(f"✅ Saved Markdown to {output_path}")
+    def save_all(self, data: Dict[str, Any], json_path: str, txt_path: str, md_path: str):
+        """Save JSON, then write the TXT and Markdown views in a single pass over tasks"""
+        self.save_json(data, json_path)
+
+        with open(txt_path, "w", encoding="utf-8") as tf, \
+                open(md_path, "w", encoding="utf-8") as mf:
+            mf.write(f"# Project: {data['project']['name']}\n")
+            for i, t in enumerate(data["tasks"]):
+                if i:
+                    tf.write("\n")
+                tf.write(f"[{t['id']}] {t['task_name']} -> {t.get('resource', '')}")
+                mf.write(
+                    f"\n### Task {t['id']}\n- **Name:** {t['task_name']}\n- **Resource:** {t.get('resource','')}\n- **Start:** {t['start_date']}\n- **Finish:** {t['finish_date']}\n")
+        print(f"✅ Saved TXT to {txt_path}")
+        print(f"✅ Saved Markdown to {md_path}")
 
 # ------------------------------
 # CLI / Runner
 # ------------------------------
 
 
+def _print_timing(t_extract: float, t_save: float):
+    print(f"⏱️  Extract: {t_extract:.2f}s | Save: {t_save:.2f}s | "
+          f"Total: {t_extract + t_save:.2f}s")
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _output_paths(pdf: str, output_dir: str) -> Tuple[str, str, str]:
+    """Return the JSON/TXT/MD output paths for a PDF."""
+    base = os.path.join(output_dir, os.path.splitext(os.path.basename(pdf))[0])
+    return base + ".json", base + ".txt", base + ".md"
+
+
+def _process_one(pdf: str, output_dir: str, debug: bool,
+                 engine: str = "pdfplumber") -> Tuple[str, str]:
+    """
+    Extract one PDF and write its JSON/TXT/MD outputs (batch worker).
+    Returns (status, captured output) so the parent can print each file's
+    log in one piece; status is "processed", "skipped" or "failed".
+    """
+    log = io.StringIO()
+    status = "skipped"
+    with redirect_stdout(log):
+        try:
+            print(f"\n{'='*60}")
+            print(f"Processing: {os.path.basename(pdf)}")
+            print('='*60)
+
+            extractor = ProjectPlanExtractor(debug=debug, engine=engine)
+            t0 = time.perf_counter()
+            data = extractor.extract_from_pdf(pdf)
+            t_extract = time.perf_counter() - t0
+
+            if data is None:
+                print(f"⏭️  Skipped: No tasks with resources")
+                return status, log.getvalue()
+
+            extractor.save_all(data, *_output_paths(pdf, output_dir))
+            _print_timing(t_extract, time.perf_counter() - t0 - t_extract)
+            status = "processed"
+
+        except OSError as e:
+            # Unreadable input or unwritable output: the rest of the batch goes on
+            status = "failed"
+            print(f"❌ Cannot read/write {pdf}: {e}")
+        except Exception as e:
+            # Typically a corrupt or malformed PDF rejected by the parser
+            status = "failed"
+            print(f"❌ Error processing {pdf}: {e}")
+            if debug:
+                import traceback
+                # Into the captured log so it prints in order with this file
+                traceback.print_exc(file=sys.stdout)
+
+    return status, log.getvalue()
+
+
 def main():
     OUTPUT_DIR = "../extract"
     os.makedirs(OUTPUT_DIR, exist_ok=True)
@@ -495,11 +666,23 @@ def main():
         "--out", help="Output JSON path (if single file)", default=None)
     parser.add_argument("--debug", action="store_true",
                         help="Enable debug prints")
+    parser.add_argument("--engine", choices=["pdfplumber", "pymupdf"], default="pdfplumber",
+                        help="Text extraction backend; pymupdf is faster but may split "
+                             "table rows differently (default: pdfplumber)")
+    parser.add_argument("--workers", type=_positive_int, default=None,
+                        help="Worker processes: PDFs in parallel with --dir, pages in parallel "
+                             "for a single PDF of 10+ pages (default: CPU count)")
     args = parser.parse_args()
 
-    extractor = ProjectPlanExtractor(debug=args.debug)
+    extractor = ProjectPlanExtractor(
+        debug=args.debug, workers=args.workers or os.cpu_count() or 1,
+        engine=args.engine)
 
     if args.dir:
+        if not os.path.isdir(args.dir):
+            print(f"❌ Directory not found: {args.dir}")
+            sys.exit(1)
+
         pdfs = [os.path.join(args.dir, p) for p in os.listdir(
             args.dir) if p.lower().endswith(".pdf")]
         if not pdfs:
@@ -508,79 +691,77 @@ def main():
 
         processed = 0
         skipped = 0
-
-        for pdf in pdfs:
-            try:
-                print(f"\n{'='*60}")
-                print(f"Processing: {os.path.basename(pdf)}")
-                print('='*60)
-
-                data = extractor.extract_from_pdf(pdf)
-
-                if data is None:
-                    print(f"⏭️  Skipped: No tasks with resources")
+        failed = 0
+
+        # PDFs are independent and parsing is CPU-bound pure Python, so spread
+        # them over worker processes; results are printed in input order
+        workers = min(args.workers or os.cpu_count() or 1, len(pdfs))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for status, log in executor.map(
+                    _process_one, pdfs, repeat(OUTPUT_DIR), repeat(args.debug),
+                    repeat(args.engine)):
+                print(log, end="")
+                if status == "processed":
+                    processed += 1
+                elif status == "failed":
+                    failed += 1
+                else:
                     skipped += 1
-                    continue
-
-                json_path = os.path.join(OUTPUT_DIR, os.path.splitext(
-                    os.path.basename(pdf))[0] + ".json")
-                txt_path = os.path.join(OUTPUT_DIR, os.path.splitext(
-                    os.path.basename(pdf))[0] + ".txt")
-                md_path = os.path.join(OUTPUT_DIR, os.path.splitext(
-                    os.path.basename(pdf))[0] + ".md")
-
-                extractor.save_json(data, json_path)
-                extractor.save_txt(data, txt_path)
-                extractor.save_md(data, md_path)
-                processed += 1
-
-            except Exception as e:
-                print(f"❌ Error processing {pdf}: {e}")
-                skipped += 1
-                if args.debug:
-                    import traceback
-                    traceback.print_exc()
 
         print(f"\n{'='*60}")
         print(f"📊 BATCH PROCESSING SUMMARY")
         print(f"{'='*60}")
         print(f"✅ Successfully processed: {processed} files")
         print(f"⏭️  Skipped (no resources): {skipped} files")
+        if failed:
+            print(f"❌ Failed: {failed} files")
         print(f"📁 Output directory: {OUTPUT_DIR}")
 
+        # Non-zero exit so shell loops and schedulers can detect failed PDFs
+        if failed:
+            sys.exit(1)
+
     else:
         if not args.pdf:
             print("No PDF provided. Use positional argument or --dir.")
             return
 
         pdf = args.pdf
-        json_path = os.path.join(OUTPUT_DIR, os.path.splitext(
-            os.path.basename(pdf))[0] + ".json")
-        txt_path = os.path.join(OUTPUT_DIR, os.path.splitext(
-            os.path.basename(pdf))[0] + ".txt")
-        md_path = os.path.join(OUTPUT_DIR, os.path.splitext(
-            os.path.basename(pdf))[0] + ".md")
+        # Reject bad input before any PDF library gets imported
+        if not os.path.isfile(pdf):
+            print(f"❌ File not found: {pdf}")
+            sys.exit(1)
+        if not pdf.lower().endswith(".pdf"):
+            print(f"❌ Not a PDF file: {pdf}")
+            sys.exit(1)
+
+        json_path, txt_path, md_path = _output_paths(pdf, OUTPUT_DIR)
 
         try:
             print(f"\n{'='*60}")
             print(f"Processing: {pdf}")
             print('='*60)
 
+            t0 = time.perf_counter()
             data = extractor.extract_from_pdf(pdf)
+            t_extract = time.perf_counter() - t0
 
             if data is None:
                 print(f"\n⏭️  No output files created: PDF has no tasks with resources")
                 return
 
-            extractor.save_json(data, json_path)
-            extractor.save_txt(data, txt_path)
-            extractor.save_md(data, md_path)
+            extractor.save_all(data, json_path, txt_path, md_path)
+            _print_timing(t_extract, time.perf_counter() - t0 - t_extract)
 
+        except OSError as e:
+            print(f"❌ Cannot read/write {pdf}: {e}")
+            sys.exit(1)
         except Exception as e:
             print(f"❌ Error processing {pdf}: {e}")
             if args.debug:
                 import traceback
                 traceback.print_exc()
+            sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -17,6 +17,12 @@ from datetime import datetime
 from typing import List, Dict, Any, Optional
 import pdfplumber
 import os
+import logging
+
+# pdfminer logs every parsed token at DEBUG level; keep it quiet even when a
+# caller lowers the root log level, or extraction slows down dramatically
+logging.getLogger("pdfminer").setLevel(logging.ERROR)
+logging.getLogger("pdfplumber").setLevel(logging.ERROR)
 
 # ------------------------------
 # Utility helpers